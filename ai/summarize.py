@@ -12,6 +12,8 @@ from urllib import request
 from .prompts import CHRONICLE_SYSTEM, CHRONICLE_USER, EXPLAIN_SYSTEM, EXPLAIN_USER
 from .mappings import CAUSE_TAG_KR
 
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
 
 def resolve_log_path(scenario: str, seed: int, log_path: Optional[str]) -> Path:
     if log_path:
@@ -126,6 +128,10 @@ def explain_tone(events: List[Dict], records: List[Dict]) -> str:
         else 0.0
     )
     max_sev = max([event.get("severity", 1) for event in events] or [1])
+    return tone_for(max_sev, avg_rebellion)
+
+
+def tone_for(max_sev: int, avg_rebellion: float) -> str:
     if max_sev >= 5 or avg_rebellion >= 75:
         return "붕괴 직전"
     if max_sev >= 4 or avg_rebellion >= 60:
@@ -186,7 +192,7 @@ def call_openai(messages: List[Dict], model: str) -> Optional[str]:
 
 def normalize_explain(text: str) -> Optional[str]:
     cleaned = " ".join(text.split())
-    sentences = [s for s in re.split(r"(?<=[.!?])\s+", cleaned) if s]
+    sentences = [s for s in SENTENCE_SPLIT.split(cleaned) if s]
     if len(sentences) < 3:
         return None
     return " ".join(sentences[:3])
@@ -4,6 +4,7 @@ import json
 import os
 import tempfile
 from collections import deque
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -526,6 +527,34 @@ def build_snapshot(scenario: str, seed: int, turns: int, tail: int, log_path: st
     )
 
 
+def log_signature(path):
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def log_explain(scenario, seed, turn_window, path_str, cursor, signature):
+    temp_path = cursor_log_view(Path(path_str), cursor)
+    try:
+        return explain_summary(scenario, seed, turn_window, temp_path or path_str)
+    finally:
+        if temp_path:
+            os.unlink(temp_path)
+
+
+def log_chronicle(scenario, seed, turns, path_str, cursor, signature):
+    temp_path = cursor_log_view(Path(path_str), cursor)
+    try:
+        return chronicle_summary(scenario, seed, turns, temp_path or path_str)
+    finally:
+        if temp_path:
+            os.unlink(temp_path)
+
+
+# Only the rule path is deterministic; handlers skip the cache when an API key is set.
+cached_explain = lru_cache(maxsize=128)(log_explain)
+cached_chronicle = lru_cache(maxsize=128)(log_chronicle)
+
+
 @app.post("/ai/explain")
 async def explain(request: ExplainRequest):
     if request.scenario not in VALID_SCENARIOS:
@@ -533,18 +562,16 @@ async def explain(request: ExplainRequest):
     path = resolve_run_path(request.scenario, request.seed, 0, request.log_path)
     if not path.exists():
         return error_response(404, f"Log not found: {path}")
-    cursor = read_cursor(path)
-    temp_path = cursor_log_view(path, cursor)
-    try:
-        return explain_summary(
-            request.scenario,
-            request.seed,
-            request.turn_window,
-            temp_path or str(path),
-        )
-    finally:
-        if temp_path:
-            os.unlink(temp_path)
+    summarize = log_explain if os.getenv("OPENAI_API_KEY") else cached_explain
+    result = summarize(
+        request.scenario,
+        request.seed,
+        request.turn_window,
+        str(path),
+        read_cursor(path),
+        log_signature(path),
+    )
+    return dict(result)
 
 
 @app.post("/ai/chronicle")
@@ -554,18 +581,16 @@ async def chronicle(request: ChronicleRequest):
     path = resolve_run_path(request.scenario, request.seed, request.turns, request.log_path)
     if not path.exists():
         return error_response(404, f"Log not found: {path}")
-    cursor = read_cursor(path)
-    temp_path = cursor_log_view(path, cursor)
-    try:
-        return chronicle_summary(
-            request.scenario,
-            request.seed,
-            request.turns,
-            temp_path or str(path),
-        )
-    finally:
-        if temp_path:
-            os.unlink(temp_path)
+    summarize = log_chronicle if os.getenv("OPENAI_API_KEY") else cached_chronicle
+    result = summarize(
+        request.scenario,
+        request.seed,
+        request.turns,
+        str(path),
+        read_cursor(path),
+        log_signature(path),
+    )
+    return dict(result)
 
 
 @app.post("/api/snapshot")
@@ -587,14 +612,10 @@ async def run_snapshot(request: RunRequest):
         return error_response(400, "Invalid scenario")
     if request.turns < 2:
         return error_response(400, "turns must be >= 2")
-    from scripts.run_sim import run_with_scenario
-    from sim.simulate import run_simulation, write_jsonl
+    from sim.simulate import run_columnar, write_jsonl
 
     rng = __import__("random").Random(request.seed)
-    if request.scenario == "baseline":
-        log, _summary = run_simulation(request.turns, rng)
-    else:
-        log, _summary = run_with_scenario(request.turns, rng, request.scenario)
+    log, _summary = run_columnar(request.turns, rng, request.scenario)
 
     out_path = resolve_run_path(request.scenario, request.seed, request.turns, None)
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -1067,6 +1088,9 @@ async def demo_page():
       let currentLogPath = null;
       let currentCursor = null;
       let currentMaxTurn = null;
+      const actorNodes = new Map();
+      let resyncDelay = 500;
+      let resyncTimer = null;
 
       function payload() {
         const data = new FormData(form);
@@ -1089,6 +1113,35 @@ async def demo_page():
         }
       }
 
+      function scheduleResync() {
+        if (resyncTimer !== null) {
+          return;
+        }
+        resyncTimer = setTimeout(resync, resyncDelay);
+        resyncDelay = Math.min(resyncDelay * 2, 60000);
+      }
+
+      function resync() {
+        resyncTimer = null;
+        runSnapshot("/api/snapshot", snapshotBody);
+      }
+
+      async function postJson(url, body) {
+        let response;
+        try {
+          response = await fetch(url, {
+            method: "POST",
+            headers: { "Content-Type": "application/json" },
+            body: JSON.stringify(body),
+          });
+        } catch (err) {
+          scheduleResync();
+          throw err;
+        }
+        resyncDelay = 500;
+        return response;
+      }
+
       function refreshNextTurnButton() {
         if (!nextTurnButton) {
           return;
@@ -1187,10 +1240,8 @@ async def demo_page():
           const button = document.createElement("button");
           button.className = index === 0 ? "primary" : "secondary";
           button.textContent = choice.label || choice.id;
-          button.addEventListener("click", (event) => {
-            event.preventDefault();
-            sendDecision(decision.id, choice.id);
-          });
+          button.dataset.decision = decision.id;
+          button.dataset.choice = choice.id;
           decisionActions.appendChild(button);
         });
       }
@@ -1206,16 +1257,12 @@ async def demo_page():
         const data = payload();
         try {
           const turns = currentMaxTurn ?? data.turns;
-          const response = await fetch("/api/pending_decision", {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({
-              scenario: data.scenario,
-              seed: data.seed,
-              turns: turns,
-              tail: 20,
-              log_path: data.log_path,
-            }),
+          const response = await postJson("/api/pending_decision", {
+            scenario: data.scenario,
+            seed: data.seed,
+            turns: turns,
+            tail: 20,
+            log_path: data.log_path,
           });
           if (!response.ok) {
             throw new Error(`HTTP ${response.status}`);
@@ -1248,17 +1295,13 @@ async def demo_page():
         setNextTurnLock(true);
         try {
           const turns = currentMaxTurn ?? data.turns;
-          const response = await fetch("/api/decide", {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({
-              scenario: data.scenario,
-              seed: data.seed,
-              turns: turns,
-              decision_id: decisionId,
-              choice: choice,
-              log_path: data.log_path,
-            }),
+          const response = await postJson("/api/decide", {
+            scenario: data.scenario,
+            seed: data.seed,
+            turns: turns,
+            decision_id: decisionId,
+            choice: choice,
+            log_path: data.log_path,
           });
           if (!response.ok) {
             throw new Error(`HTTP ${response.status}`);
@@ -1274,6 +1317,41 @@ async def demo_page():
         }
       }
 
+      function renderActors(actorData) {
+        const actorEntries = Object.entries(actorData);
+        if (actorEntries.length === 0) {
+          actorNodes.clear();
+          actors.innerHTML = "<div class='actor'>인물 데이터 로딩 필요</div>";
+          return;
+        }
+        if (actorNodes.size === 0) {
+          actors.innerHTML = "";
+        }
+        const seen = new Set();
+        actorEntries.forEach(([name, stats]) => {
+          seen.add(name);
+          const text = `${name} · loyalty ${stats.loyalty} · ambition ${stats.ambition} · influence ${stats.influence}`;
+          let entry = actorNodes.get(name);
+          if (!entry) {
+            const card = document.createElement("div");
+            card.className = "actor";
+            actors.appendChild(card);
+            entry = { card: card, text: null };
+            actorNodes.set(name, entry);
+          }
+          if (entry.text !== text) {
+            entry.card.textContent = text;
+            entry.text = text;
+          }
+        });
+        actorNodes.forEach((entry, name) => {
+          if (!seen.has(name)) {
+            entry.card.remove();
+            actorNodes.delete(name);
+          }
+        });
+      }
+
       function updateSnapshot(data, checkPending) {
         setError(data.error || null);
         if (data.log_path) {
@@ -1352,24 +1430,21 @@ async def demo_page():
           factions.appendChild(bar);
         });
 
-        actors.innerHTML = "";
-        const actorData = data.actors || {};
-        const actorEntries = Object.entries(actorData);
-        if (actorEntries.length === 0) {
-          actors.innerHTML = "<div class='actor'>인물 데이터 로딩 필요</div>";
-        } else {
-          actorEntries.forEach(([name, stats]) => {
-            const card = document.createElement("div");
-            card.className = "actor";
-            card.textContent = `${name} · loyalty ${stats.loyalty} · ambition ${stats.ambition} · influence ${stats.influence}`;
-            actors.appendChild(card);
-          });
-        }
+        renderActors(data.actors || {});
         if (checkPending) {
           fetchPendingDecision();
         }
       }
 
+      decisionActions.addEventListener("click", (event) => {
+        const button = event.target.closest("button[data-choice]");
+        if (!button) {
+          return;
+        }
+        event.preventDefault();
+        sendDecision(button.dataset.decision, button.dataset.choice);
+      });
+
       document.getElementById("explain").addEventListener("click", (event) => {
         event.preventDefault();
         const data = payload();
@@ -1392,14 +1467,20 @@ async def demo_page():
         }, chronicleMode, chronicleResult);
       });
 
+      function snapshotBody(data) {
+        return {
+          scenario: data.scenario,
+          seed: data.seed,
+          turns: data.turns,
+          tail: 200,
+          log_path: data.log_path,
+        };
+      }
+
       async function runSnapshot(url, body) {
         const data = payload();
         try {
-          const response = await fetch(url, {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify(body(data)),
-          });
+          const response = await postJson(url, body(data));
           if (!response.ok) {
             throw new Error(`HTTP ${response.status}`);
           }
@@ -1412,13 +1493,7 @@ async def demo_page():
 
       document.getElementById("load").addEventListener("click", (event) => {
         event.preventDefault();
-        runSnapshot("/api/snapshot", (data) => ({
-          scenario: data.scenario,
-          seed: data.seed,
-          turns: data.turns,
-          tail: 200,
-          log_path: data.log_path,
-        }));
+        runSnapshot("/api/snapshot", snapshotBody);
       });
 
       document.getElementById("run").addEventListener("click", (event) => {
@@ -1445,16 +1520,12 @@ async def demo_page():
         }
         budgetSave.disabled = true;
         try {
-          const response = await fetch("/api/set_budget", {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({
-              scenario: data.scenario,
-              seed: data.seed,
-              turns: data.turns,
-              budget: budget,
-              log_path: data.log_path,
-            }),
+          const response = await postJson("/api/set_budget", {
+            scenario: data.scenario,
+            seed: data.seed,
+            turns: data.turns,
+            budget: budget,
+            log_path: data.log_path,
           });
           if (!response.ok) {
             throw new Error(`HTTP ${response.status}`);
@@ -1473,16 +1544,12 @@ async def demo_page():
         const data = payload();
         setNextTurnRunning(true);
         try {
-          const response = await fetch("/api/next_turn", {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({
-              scenario: data.scenario,
-              seed: data.seed,
-              turns: data.turns,
-              tail: 200,
-              log_path: data.log_path,
-            }),
+          const response = await postJson("/api/next_turn", {
+            scenario: data.scenario,
+            seed: data.seed,
+            turns: data.turns,
+            tail: 200,
+            log_path: data.log_path,
           });
           if (!response.ok) {
             throw new Error(`HTTP ${response.status}`);
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import argparse
 import random
+import statistics
 from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
 
-from ai.summarize import compact_events, explain_tone, rule_chronicle, rule_explain
+from ai.summarize import rule_chronicle, rule_explain, tone_for
 from sim.engine import step
-from sim.simulate import normalize_actor
-from sim.state import initial_state, serialize_state
+from sim.events import compact_event
+from sim.runlog import RunLog
+from sim.state import initial_state
 
 
 def parse_args() -> argparse.Namespace:
@@ -19,23 +22,43 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def window_records(records, window: int) -> list[dict]:
-    if not records:
-        return []
-    return records[-max(window, 1) :]
+def window_start(log: RunLog, window: int) -> int:
+    return max(log.size - max(window, 1), 0)
 
 
-def build_event_log(event) -> dict:
-    if event is None:
-        return None
-    return {
-        "id": event.id,
-        "title": event.title,
-        "actor": normalize_actor(event.actor),
-        "cause_tags": event.cause_tags,
-        "severity": event.severity,
-        "stakeholders": event.stakeholders,
-    }
+def compact_events(log: RunLog, start: int = 0) -> List[Dict]:
+    return [
+        compact_event(event, log.turn[i])
+        for i, event in enumerate(log.events[start : log.size], start)
+        if event is not None
+    ]
+
+
+def window_tone(log: RunLog, start: int = 0) -> str:
+    severity = [0 if event is None else event.severity for event in log.events[start : log.size]]
+    return tone_for(*tone_scores(severity, log.scalars["revolt_risk"][start : log.size]))
+
+
+def window_records(log: RunLog, start: int = 0) -> List[Dict]:
+    revolt_risk = log.scalars["revolt_risk"]
+    return [
+        {"state": {"turn": log.turn[i], "revolt_risk": revolt_risk[i]}}
+        for i in range(start, log.size)
+    ]
+
+
+def tone_scores(severity: Sequence[int], revolt_risk: Sequence[float]) -> Tuple[int, float]:
+    max_sev = max(max(severity, default=0), 1)
+    avg_rebellion = statistics.mean(revolt_risk) if revolt_risk else 0.0
+    return max_sev, avg_rebellion
+
+
+def write_report(path: Path, lines: List[str]) -> None:
+    with path.open("wb", buffering=1 << 16) as handle:
+        for index, line in enumerate(lines):
+            if index:
+                handle.write(b"\n")
+            handle.write(line.encode("utf-8"))
 
 
 def main() -> None:
@@ -43,7 +66,7 @@ def main() -> None:
     rng = random.Random(args.seed)
     state = initial_state(args.scenario)
 
-    records: list[dict] = []
+    log = RunLog(max(args.turns, 0))
     auto_turns: list[int] = []
     forced_turns: list[int] = []
     explain_calls: list[dict] = []
@@ -53,32 +76,26 @@ def main() -> None:
 
     for _ in range(args.turns):
         state, event = step(state, rng)
-        record = {
-            "state": serialize_state(state),
-            "event": build_event_log(event),
-        }
-        records.append(record)
+        log.append(state, event)
 
-        current_turn = record["state"]["turn"]
+        current_turn = state.turn
+        start = window_start(log, window)
         if event is not None and event.severity >= 3 and current_turn not in called_turns:
-            windowed = window_records(records, window)
-            text = rule_explain(compact_events(windowed), windowed)
+            text = rule_explain(compact_events(log, start), window_records(log, start))
             explain_calls.append({"turn": current_turn, "mode": "auto", "text": text})
             auto_turns.append(current_turn)
             called_turns.add(current_turn)
 
         if not forced_triggered:
-            windowed = window_records(records, window)
-            tone = explain_tone(compact_events(windowed), windowed)
-            if tone == "붕괴 직전":
+            if window_tone(log, start) == "붕괴 직전":
                 if current_turn not in called_turns:
-                    text = rule_explain(compact_events(windowed), windowed)
+                    text = rule_explain(compact_events(log, start), window_records(log, start))
                     explain_calls.append({"turn": current_turn, "mode": "forced", "text": text})
                     called_turns.add(current_turn)
                 forced_turns.append(current_turn)
                 forced_triggered = True
 
-    chronicle = rule_chronicle(compact_events(records))
+    chronicle = rule_chronicle(compact_events(log))
 
     report_lines = [
         "# Demo Report",
@@ -102,7 +119,7 @@ def main() -> None:
 
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text("\n".join(report_lines), encoding="utf-8")
+    write_report(out_path, report_lines)
 
 
 if __name__ == "__main__":
@@ -4,12 +4,12 @@ import argparse
 import csv
 import random
 import statistics
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List
 
-from sim.engine import is_bankrupt, is_riot, step
 from sim.metrics import compute_metrics
-from sim.state import initial_state, serialize_state
+from sim.simulate import minimal_record_fn, run_with_scenario
 
 SCENARIOS = ("baseline", "famine", "deficit", "warlord")
 METRIC_KEYS = (
@@ -27,38 +27,22 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--turns", type=int, default=120, help="Turns per run")
     parser.add_argument("--seeds", nargs=2, type=int, default=[0, 99], help="Seed range")
     parser.add_argument("--out", type=str, default="out", help="Output directory")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPU count)"
+    )
     return parser.parse_args()
 
 
 def run_once(turns: int, seed: int, scenario: str) -> Dict:
-    rng = random.Random(seed)
-    state = initial_state(scenario)
-    log: List[Dict] = []
-    bankruptcies = 0
-    riots = 0
-    support_total = 0.0
-
-    for _ in range(turns):
-        state, event = step(state, rng)
-        if is_bankrupt(state):
-            bankruptcies += 1
-        if is_riot(state):
-            riots += 1
-        support_total += state.public_support
-        log.append(
-            {
-                "state": serialize_state(state),
-                "event": None if event is None else {"id": event.id, "title": event.title},
-            }
-        )
-
+    log, summary = run_with_scenario(
+        turns, random.Random(seed), scenario, minimal_record_fn(), decisions=False
+    )
     metrics = compute_metrics(log)
-    avg_support = support_total / max(turns, 1)
     return {
         "seed": seed,
-        "riots": riots,
-        "bankruptcies": bankruptcies,
-        "avg_public_support": round(avg_support, 2),
+        "riots": summary["riots"],
+        "bankruptcies": summary["bankruptcies"],
+        "avg_public_support": summary["avg_public_support"],
         "avg_rebellion_risk": metrics["avg_rebellion_risk"],
         "min_public_support": metrics["min_public_support"],
         "faction_clamp_hits": metrics["faction_clamp_hits"],
@@ -106,9 +90,21 @@ def main() -> None:
     seeds = range(start_seed, end_seed + 1)
     out_dir = Path(args.out)
 
+    tasks = [(scenario, seed) for scenario in SCENARIOS for seed in seeds]
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = pool.map(
+            run_once,
+            [args.turns] * len(tasks),
+            [seed for _scenario, seed in tasks],
+            [scenario for scenario, _seed in tasks],
+            chunksize=max(len(tasks) // 32, 1),
+        )
+        rows_by_scenario: Dict[str, List[Dict]] = {scenario: [] for scenario in SCENARIOS}
+        for (scenario, _seed), row in zip(tasks, results):
+            rows_by_scenario[scenario].append(row)
+
     summaries: Dict[str, Dict[str, Dict[str, float]]] = {}
-    for scenario in SCENARIOS:
-        rows = [run_once(args.turns, seed, scenario) for seed in seeds]
+    for scenario, rows in rows_by_scenario.items():
         write_csv(out_dir / f"{scenario}.csv", rows)
         summaries[scenario] = summarize(rows)
 
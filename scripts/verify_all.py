@@ -2,12 +2,32 @@ from __future__ import annotations
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
 def run_step(name: str, command: list[str]) -> None:
     print(f"[verify] {name}: {' '.join(command)}")
     result = subprocess.run(command, check=False)
+    check_result(name, result)
+
+
+def run_parallel(steps: list[tuple[str, list[str]]]) -> None:
+    def run_captured(step: tuple[str, list[str]]) -> subprocess.CompletedProcess:
+        _name, command = step
+        return subprocess.run(command, check=False, capture_output=True, text=True)
+
+    with ThreadPoolExecutor(max_workers=len(steps)) as pool:
+        results = list(pool.map(run_captured, steps))
+
+    for (name, command), result in zip(steps, results):
+        print(f"[verify] {name}: {' '.join(command)}")
+        sys.stdout.write(result.stdout)
+        sys.stderr.write(result.stderr)
+        check_result(name, result)
+
+
+def check_result(name: str, result: subprocess.CompletedProcess) -> None:
     if result.returncode != 0:
         print(f"[verify] FAILED: {name} (exit {result.returncode})")
         sys.exit(result.returncode)
@@ -21,26 +41,30 @@ def main() -> None:
     out_dir = Path("out")
     out_dir.mkdir(parents=True, exist_ok=True)
 
+    run_steps = []
     for scenario in scenarios:
         out_path = out_dir / f"run_{scenario}.jsonl"
         if scenario == "baseline":
             out_path = out_dir / "run_baseline.jsonl"
-        run_step(
-            f"run_sim {scenario}",
-            [
-                python,
-                "-m",
-                "scripts.run_sim",
-                "--turns",
-                "120",
-                "--seed",
-                "42",
-                "--scenario",
-                scenario,
-                "--out",
-                str(out_path),
-            ],
+        run_steps.append(
+            (
+                f"run_sim {scenario}",
+                [
+                    python,
+                    "-m",
+                    "scripts.run_sim",
+                    "--turns",
+                    "120",
+                    "--seed",
+                    "42",
+                    "--scenario",
+                    scenario,
+                    "--out",
+                    str(out_path),
+                ],
+            )
         )
+    run_parallel(run_steps)
 
     run_step(
         "sweep",
@@ -1,42 +1,77 @@
 from __future__ import annotations
 
 import random
-from typing import Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 
 from fastapi import FastAPI, Query
 
 from .engine import is_bankrupt, is_riot, step
 from .simulate import run_simulation
-from .state import initial_state, serialize_state
+from .state import State, initial_state, serialize_state
 
 app = FastAPI(title="Korean Paradox Prototype")
 
-_rng = random.Random(42)
-_state = initial_state()
+DEFAULT_SEED = 42
+DEFAULT_SESSION = "default"
+MAX_SESSIONS = 256
 
 
-def _reset(seed: Optional[int] = None) -> None:
-    global _rng
-    global _state
+@dataclass
+class Session:
+    rng: random.Random
+    state: State
+    snapshot: Optional[Tuple[State, Dict]] = None
+
+
+_sessions: OrderedDict[str, Session] = OrderedDict()
+
+
+def _new_session() -> Session:
+    return Session(rng=random.Random(DEFAULT_SEED), state=initial_state())
+
+
+def _session(session_id: str) -> Session:
+    session = _sessions.get(session_id)
+    if session is None:
+        session = _sessions[session_id] = _new_session()
+        if len(_sessions) > MAX_SESSIONS:
+            _sessions.popitem(last=False)
+    else:
+        _sessions.move_to_end(session_id)
+    return session
+
+
+def _serialized(session: Session) -> Dict:
+    snapshot = session.snapshot
+    if snapshot is None or snapshot[0] is not session.state:
+        snapshot = session.snapshot = (session.state, serialize_state(session.state))
+    return snapshot[1]
+
+
+def _reset(session_id: str, seed: Optional[int] = None) -> Session:
+    session = _session(session_id)
     if seed is not None:
-        _rng = random.Random(seed)
-    _state = initial_state()
+        session.rng = random.Random(seed)
+    session.state = initial_state()
+    return session
 
 
 @app.get("/state")
-async def get_state():
-    return {"state": serialize_state(_state)}
+async def get_state(session_id: str = Query(DEFAULT_SESSION)):
+    return {"state": _serialized(_session(session_id))}
 
 
 @app.post("/step")
-async def step_state():
-    global _state
-    _state, event = step(_state, _rng)
+async def step_state(session_id: str = Query(DEFAULT_SESSION)):
+    session = _session(session_id)
+    session.state, event = step(session.state, session.rng)
     return {
-        "state": serialize_state(_state),
+        "state": _serialized(session),
         "event": None if event is None else {"id": event.id, "title": event.title},
-        "bankrupt": is_bankrupt(_state),
-        "riot": is_riot(_state),
+        "bankrupt": is_bankrupt(session.state),
+        "riot": is_riot(session.state),
     }
 
 
@@ -44,8 +79,8 @@ async def step_state():
 async def run_state(
     turns: int = Query(120, ge=1, le=500),
     seed: Optional[int] = Query(None),
+    session_id: str = Query(DEFAULT_SESSION),
 ):
-    if seed is not None:
-        _reset(seed)
-    log, summary = run_simulation(turns, _rng)
+    session = _reset(session_id, seed) if seed is not None else _session(session_id)
+    log, summary = run_simulation(turns, session.rng)
     return {"summary": summary, "log": log}
@@ -1,46 +1,85 @@
 from __future__ import annotations
 
-from dataclasses import replace
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 from .events import Event, choose_event
-from .state import State, apply_deltas, clamp
-
-
-def balance_score(factions: dict[str, float]) -> float:
-    values = list(factions.values())
-    return max(values) - min(values)
+from .state import (
+    Actors,
+    ActorStats,
+    Factions,
+    State,
+    apply_deltas,
+    clamp,
+    shifted_scalars,
+)
+
+
+def balance_score(factions: Factions) -> float:
+    royal, bureaucrats, warlords, merchants, clans = factions
+    high = royal if royal > bureaucrats else bureaucrats
+    low = bureaucrats if royal > bureaucrats else royal
+    for value in (warlords, merchants, clans):
+        if value > high:
+            high = value
+        elif value < low:
+            low = value
+    return high - low
+
+
+def turn_scalars(state: State) -> Dict[str, float]:
+    factions = state.factions
+    treasury_delta, support_delta, stability_delta, revolt_delta = turn_deltas(
+        state.stability,
+        state.legitimacy,
+        state.food,
+        state.public_support,
+        factions.bureaucrats,
+        factions.merchants,
+        factions.warlords,
+        balance_score(factions),
+    )
+    return shifted_scalars(
+        state,
+        {
+            "treasury": treasury_delta,
+            "public_support": support_delta,
+            "stability": stability_delta,
+            "revolt_risk": revolt_delta,
+        },
+    )
 
 
-def compute_turn_updates(state: State) -> State:
-    balance = balance_score(state.factions)
-    food_pressure = 50.0 - state.food
+def turn_deltas(
+    stability: float,
+    legitimacy: float,
+    food: float,
+    public_support: float,
+    bureaucrats: float,
+    merchants: float,
+    warlords: float,
+    balance: float,
+) -> Tuple[float, float, float, float]:
+    food_deficit = max(50.0 - food, 0.0)
 
-    treasury_delta = (state.factions["bureaucrats"] + state.factions["merchants"]) / 50.0
+    treasury_delta = (bureaucrats + merchants) / 50.0
     treasury_delta -= balance / 60.0
-    treasury_delta -= max(food_pressure, 0.0) / 25.0
+    treasury_delta -= food_deficit / 25.0
 
-    support_delta = (state.legitimacy - 50.0) / 18.0
+    support_delta = (legitimacy - 50.0) / 18.0
     support_delta -= balance / 55.0
-    support_delta -= max(food_pressure, 0.0) / 22.0
+    support_delta -= food_deficit / 22.0
 
-    stability_delta = (state.public_support - 50.0) / 20.0
+    stability_delta = (public_support - 50.0) / 20.0
     stability_delta -= balance / 65.0
-    stability_delta -= max(food_pressure, 0.0) / 30.0
+    stability_delta -= food_deficit / 30.0
 
     revolt_delta = 0.0
-    revolt_delta += max(0.0, 45.0 - state.public_support) / 20.0
-    revolt_delta += max(0.0, state.factions["warlords"] - 55.0) / 18.0
-    revolt_delta += max(0.0, 45.0 - state.food) / 16.0
-    revolt_delta -= max(0.0, state.stability - 60.0) / 22.0
+    revolt_delta += max(0.0, 45.0 - public_support) / 20.0
+    revolt_delta += max(0.0, warlords - 55.0) / 18.0
+    revolt_delta += max(0.0, 45.0 - food) / 16.0
+    revolt_delta -= max(0.0, stability - 60.0) / 22.0
 
-    return apply_deltas(
-        state,
-        treasury=treasury_delta,
-        public_support=support_delta,
-        stability=stability_delta,
-        revolt_risk=revolt_delta,
-    )
+    return treasury_delta, support_delta, stability_delta, revolt_delta
 
 
 def is_bankrupt(state: State) -> bool:
@@ -52,38 +91,35 @@ def is_riot(state: State) -> bool:
 
 
 def step(state: State, rng) -> Tuple[State, Optional[Event]]:
-    updated = compute_turn_updates(state)
-    updated = replace(updated, turn=state.turn + 1)
-    updated = apply_actor_drift(updated)
+    scalars = turn_scalars(state)
+    actors = actor_drift(
+        scalars["stability"],
+        scalars["legitimacy"],
+        scalars["treasury"],
+        scalars["public_support"],
+        scalars["revolt_risk"],
+        state.factions,
+        state.actors,
+    )
+    updated = State(
+        turn=state.turn + 1,
+        riot_cooldown_until=state.riot_cooldown_until,
+        factions=state.factions,
+        actors=actors,
+        **scalars,
+    )
 
     event = choose_event(updated, rng)
     if event is None:
         return updated, None
 
     choice = event.choose(rng)
-    updated = event.apply(choice, updated)
-    updated = apply_faction_soft_caps(state, updated)
-    return updated, event
-
-
-def apply_faction_soft_caps(previous: State, updated: State) -> State:
-    factions = dict(updated.factions)
-    for key, value in updated.factions.items():
-        before = previous.factions.get(key, value)
-        delta = value - before
-        if delta <= 0:
-            continue
-        if before >= 95.0:
-            delta *= 0.15
-        elif before >= 85.0:
-            delta *= 0.35
-        factions[key] = clamp(before + delta)
-    return replace(updated, factions=factions)
+    return event.apply(choice, updated), event
 
 
 DECISION_DURATION = 10
 DECISION_ID = "riot-policy"
-DECISION_CAUSE_TAGS = ["riot", "security"]
+DECISION_CAUSE_TAGS = ("riot", "security")
 
 
 def apply_decision_immediate(state: State, choice: str) -> State:
@@ -99,47 +135,55 @@ def apply_decision_tick(state: State, choice: str) -> State:
 
 
 def clamp_delta(value: float, limit: float = 2.0) -> float:
-    return max(-limit, min(limit, value))
-
-
-def apply_actor_drift(state: State) -> State:
-    actors = {role: dict(stats) for role, stats in state.actors.items()}
-
-    def adjust(role: str, loyalty: float, ambition: float, influence: float) -> None:
-        stats = actors[role]
-        stats["loyalty"] = clamp(stats["loyalty"] + clamp_delta(loyalty))
-        stats["ambition"] = clamp(stats["ambition"] + clamp_delta(ambition))
-        stats["influence"] = clamp(stats["influence"] + clamp_delta(influence))
-
-    adjust(
-        "Chancellor",
-        loyalty=(state.stability - 50.0) / 30.0,
-        ambition=(state.factions["bureaucrats"] - 50.0) / 35.0,
-        influence=(state.legitimacy - 50.0) / 30.0,
-    )
-    adjust(
-        "General",
-        loyalty=(state.stability - 50.0) / 35.0 + (state.factions["warlords"] - 50.0) / 60.0,
-        ambition=(state.factions["warlords"] - 50.0) / 30.0,
-        influence=(state.revolt_risk - 50.0) / 30.0,
-    )
-    adjust(
-        "Treasurer",
-        loyalty=(state.treasury - 50.0) / 28.0,
-        ambition=(50.0 - state.treasury) / 35.0,
-        influence=(state.factions["merchants"] - 50.0) / 40.0,
-    )
-    adjust(
-        "ClanHead",
-        loyalty=(state.stability - 50.0) / 35.0 + (state.factions["clans"] - 50.0) / 60.0,
-        ambition=(state.factions["clans"] - 50.0) / 28.0,
-        influence=(state.public_support - 50.0) / 40.0,
-    )
-    adjust(
-        "Spymaster",
-        loyalty=(state.legitimacy - 50.0) / 35.0,
-        ambition=(state.revolt_risk - 50.0) / 30.0,
-        influence=(50.0 - state.public_support) / 40.0,
+    return -limit if value <= -limit else limit if value >= limit else value
+
+
+def actor_drift(
+    stability: float,
+    legitimacy: float,
+    treasury: float,
+    public_support: float,
+    revolt_risk: float,
+    factions: Factions,
+    actors: Actors,
+) -> Actors:
+    warlords = factions.warlords
+    clans = factions.clans
+    drift = (
+        (
+            (stability - 50.0) / 30.0,
+            (factions.bureaucrats - 50.0) / 35.0,
+            (legitimacy - 50.0) / 30.0,
+        ),
+        (
+            (stability - 50.0) / 35.0 + (warlords - 50.0) / 60.0,
+            (warlords - 50.0) / 30.0,
+            (revolt_risk - 50.0) / 30.0,
+        ),
+        (
+            (treasury - 50.0) / 28.0,
+            (50.0 - treasury) / 35.0,
+            (factions.merchants - 50.0) / 40.0,
+        ),
+        (
+            (stability - 50.0) / 35.0 + (clans - 50.0) / 60.0,
+            (clans - 50.0) / 28.0,
+            (public_support - 50.0) / 40.0,
+        ),
+        (
+            (legitimacy - 50.0) / 35.0,
+            (revolt_risk - 50.0) / 30.0,
+            (50.0 - public_support) / 40.0,
+        ),
     )
 
-    return replace(state, actors=actors)
+    return Actors._make(
+        [
+            ActorStats(
+                clamp(stats[0] + clamp_delta(loyalty)),
+                clamp(stats[1] + clamp_delta(ambition)),
+                clamp(stats[2] + clamp_delta(influence)),
+            )
+            for stats, (loyalty, ambition, influence) in zip(actors, drift)
+        ]
+    )
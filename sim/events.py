@@ -1,9 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, replace
-from typing import Callable, List, Optional
-
-from .state import State, apply_deltas, apply_faction_deltas
+from bisect import bisect_left
+from dataclasses import dataclass, fields, replace
+from itertools import accumulate
+from operator import attrgetter, eq, ge, gt, le, lt
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from .state import (
+    ACTOR_INDEX,
+    ACTOR_STAT_INDEX,
+    FACTION_INDEX,
+    State,
+    apply_deltas,
+    apply_update,
+)
 
 MINOR_RIOT_COOLDOWN_TURNS = 2
 MAJOR_RIOT_COOLDOWN_TURNS = 6
@@ -22,69 +32,172 @@ CAUSE_TAGS = (
     "military",
     "riot",
 )
+COMPARISONS: Dict[str, Callable[[float, float], bool]] = {
+    "<": lt,
+    "<=": le,
+    ">": gt,
+    ">=": ge,
+    "==": eq,
+}
+STATE_FIELDS = frozenset(item.name for item in fields(State))
+
+Clause = Tuple[str, str, Union[float, str]]
+Condition = Tuple[Clause, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventChoice:
     id: str
     label: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Event:
     id: str
     title: str
     weight: float
     priority: int
     choices: List[EventChoice]
-    condition: Callable[[State], bool]
+    condition: Condition
     apply: Callable[[str, State], State]
     actor: str = "system"
-    cause_tags: List[str] = field(default_factory=list)
+    cause_tags: Tuple[str, ...] = ()
     severity: int = 1
-    stakeholders: List[str] = field(default_factory=list)
+    stakeholders: Tuple[str, ...] = ()
 
     def choose(self, rng) -> str:
         return rng.choice(self.choices).id
 
 
-def choose_event(state: State, rng) -> Optional[Event]:
-    eligible = [event for event in EVENTS if event.condition(state)]
-    if not eligible:
-        return None
+def normalize_actor(actor: str) -> str:
+    return actor if actor in ACTOR_INDEX else "Chancellor"
 
-    eligible = apply_riot_gate(eligible, state, rng)
-    if not eligible:
+
+def serialize_event(event: Optional[Event]) -> Optional[Dict]:
+    if event is None:
         return None
+    return {
+        "id": event.id,
+        "title": event.title,
+        "actor": normalize_actor(event.actor),
+        "cause_tags": event.cause_tags,
+        "severity": event.severity,
+        "stakeholders": event.stakeholders,
+    }
+
+
+def compact_event(event: Event, turn: int) -> Dict:
+    return {
+        "turn": turn,
+        "id": event.id,
+        "actor": normalize_actor(event.actor),
+        "severity": event.severity,
+        "cause_tags": event.cause_tags,
+        "stakeholders": event.stakeholders,
+    }
 
-    max_priority = max(event.priority for event in eligible)
-    top = [event for event in eligible if event.priority == max_priority]
-    weights = [event.weight for event in top]
-    total = sum(weights)
-    pick = rng.random() * total
-    upto = 0.0
-    for event, weight in zip(top, weights):
-        upto += weight
-        if upto >= pick:
-            return event
-    return top[-1]
-
-
-def riot_condition(state: State) -> bool:
-    return (
-        state.public_support <= 30.0
-        and state.stability <= 40.0
-        and state.revolt_risk >= 60.0
-        and state.turn >= state.riot_cooldown_until
-    )
 
+def choose_event(state: State, rng) -> Optional[Event]:
+    for _priority, bucket, bucket_cum, bucket_mask in EVENTS_BY_PRIORITY:
+        mask = bucket_mask(state)
+        if not mask:
+            continue
+        eligible = [event for index, event in enumerate(bucket) if mask >> index & 1]
+        eligible = apply_riot_gate(eligible, state, rng)
+        if len(eligible) == len(bucket):
+            return pick_cumulative(bucket, bucket_cum, rng)
+        if eligible:
+            return pick_weighted(eligible, rng)
+    return None
 
-def minor_riot_condition(state: State) -> bool:
-    return (
-        state.public_support <= 45.0
-        and state.stability <= 55.0
-        and state.revolt_risk >= 55.0
-    )
+
+def pick_weighted(events: List[Event], rng) -> Event:
+    return pick_cumulative(events, cumulative_weights(events), rng)
+
+
+def pick_cumulative(events: List[Event], cum_weights: List[float], rng) -> Event:
+    pick = rng.random() * cum_weights[-1]
+    index = bisect_left(cum_weights, pick)
+    return events[index] if index < len(events) else events[-1]
+
+
+def cumulative_weights(events: List[Event]) -> List[float]:
+    return list(accumulate(event.weight for event in events))
+
+
+def group_by_priority(
+    events: List[Event],
+) -> List[Tuple[int, List[Event], List[float], Callable[[State], int]]]:
+    buckets: Dict[int, List[Event]] = {}
+    for event in events:
+        buckets.setdefault(event.priority, []).append(event)
+    return [
+        (priority, bucket, cumulative_weights(bucket), condition_mask(bucket))
+        for priority, bucket in sorted(buckets.items(), key=lambda item: item[0], reverse=True)
+    ]
+
+
+def field_getter(path: str) -> Callable[[State], float]:
+    name, *keys = path.split(".")
+    if name == "factions" and len(keys) == 1 and keys[0] in FACTION_INDEX:
+        index = FACTION_INDEX[keys[0]]
+        return lambda state: state.factions[index]
+    if (
+        name == "actors"
+        and len(keys) == 2
+        and keys[0] in ACTOR_INDEX
+        and keys[1] in ACTOR_STAT_INDEX
+    ):
+        role = ACTOR_INDEX[keys[0]]
+        stat = ACTOR_STAT_INDEX[keys[1]]
+        return lambda state: state.actors[role][stat]
+    if name in STATE_FIELDS and name not in ("factions", "actors") and not keys:
+        return attrgetter(name)
+    raise ValueError(f"Unknown state path: {path}")
+
+
+def clause_test(clause: Clause) -> Callable[[State], bool]:
+    path, op, bound = clause
+    compare = COMPARISONS.get(op)
+    if compare is None:
+        raise ValueError(f"Unsupported comparison: {op}")
+    value = field_getter(path)
+    if isinstance(bound, str):
+        other = field_getter(bound)
+        return lambda state: compare(value(state), other(state))
+    return lambda state: compare(value(state), bound)
+
+
+def condition_mask(events: List[Event]) -> Callable[[State], int]:
+    tests = [
+        (1 << index, tuple(clause_test(clause) for clause in event.condition))
+        for index, event in enumerate(events)
+    ]
+
+    def mask(state: State) -> int:
+        result = 0
+        for bit, clauses in tests:
+            for test in clauses:
+                if not test(state):
+                    break
+            else:
+                result |= bit
+        return result
+
+    return mask
+
+
+RIOT_CONDITION: Condition = (
+    ("revolt_risk", ">=", 60.0),
+    ("turn", ">=", "riot_cooldown_until"),
+    ("public_support", "<=", 30.0),
+    ("stability", "<=", 40.0),
+)
+MINOR_RIOT_CONDITION: Condition = (
+    ("revolt_risk", ">=", 55.0),
+    ("public_support", "<=", 45.0),
+    ("stability", "<=", 55.0),
+)
 
 
 def apply_riot_gate(events: List[Event], state: State, rng) -> List[Event]:
@@ -129,82 +242,106 @@ def event_major_riot(choice: str, state: State) -> State:
 
 def event_granary(choice: str, state: State) -> State:
     if choice == "audit":
-        state = apply_deltas(state, treasury=6, stability=2, legitimacy=1)
-        return apply_faction_deltas(state, {"bureaucrats": 4, "merchants": -2})
-    state = apply_deltas(state, treasury=-3, stability=-2, public_support=2)
-    return apply_faction_deltas(state, {"merchants": 5, "bureaucrats": -3})
+        return apply_update(
+            state,
+            treasury=6,
+            stability=2,
+            legitimacy=1,
+            factions={"bureaucrats": 4, "merchants": -2},
+        )
+    return apply_update(
+        state,
+        treasury=-3,
+        stability=-2,
+        public_support=2,
+        factions={"merchants": 5, "bureaucrats": -3},
+    )
 
 
 def event_border(choice: str, state: State) -> State:
     if choice == "reinforce":
-        state = apply_deltas(state, treasury=-4, stability=2, food=-2)
-        return apply_faction_deltas(state, {"warlords": 3, "royal": 2})
-    state = apply_deltas(state, stability=-3, legitimacy=-2, public_support=-1)
-    return apply_faction_deltas(state, {"warlords": 4, "royal": -3})
+        return apply_update(
+            state, treasury=-4, stability=2, food=-2, factions={"warlords": 3, "royal": 2}
+        )
+    return apply_update(
+        state, stability=-3, legitimacy=-2, public_support=-1, factions={"warlords": 4, "royal": -3}
+    )
 
 
 def event_reform(choice: str, state: State) -> State:
     if choice == "promote":
-        state = apply_deltas(state, legitimacy=4, public_support=3)
-        return apply_faction_deltas(state, {"bureaucrats": 4, "clans": -2})
-    state = apply_deltas(state, stability=-2, legitimacy=-3)
-    return apply_faction_deltas(state, {"clans": 3, "bureaucrats": -2})
+        return apply_update(
+            state, legitimacy=4, public_support=3, factions={"bureaucrats": 4, "clans": -2}
+        )
+    return apply_update(
+        state, stability=-2, legitimacy=-3, factions={"clans": 3, "bureaucrats": -2}
+    )
 
 
 def event_trade(choice: str, state: State) -> State:
     if choice == "open":
-        state = apply_deltas(state, treasury=5, public_support=1)
-        return apply_faction_deltas(state, {"merchants": 4, "warlords": -1})
-    state = apply_deltas(state, treasury=-2, stability=2)
-    return apply_faction_deltas(state, {"royal": 2, "merchants": -2})
+        return apply_update(
+            state, treasury=5, public_support=1, factions={"merchants": 4, "warlords": -1}
+        )
+    return apply_update(state, treasury=-2, stability=2, factions={"royal": 2, "merchants": -2})
 
 
 def event_harvest(choice: str, state: State) -> State:
     if choice == "release":
-        state = apply_deltas(state, food=8, public_support=3)
-        return apply_faction_deltas(state, {"royal": 1, "clans": -1})
-    state = apply_deltas(state, food=-2, treasury=4, public_support=-3)
-    return apply_faction_deltas(state, {"clans": 2, "royal": -1})
+        return apply_update(state, food=8, public_support=3, factions={"royal": 1, "clans": -1})
+    return apply_update(
+        state, food=-2, treasury=4, public_support=-3, factions={"clans": 2, "royal": -1}
+    )
 
 
 def event_royal_guard(choice: str, state: State) -> State:
     if choice == "expand":
-        state = apply_deltas(state, stability=3, treasury=-4)
-        return apply_faction_deltas(state, {"royal": 4, "bureaucrats": -1})
-    state = apply_deltas(state, stability=-2, legitimacy=-1)
-    return apply_faction_deltas(state, {"bureaucrats": 2, "royal": -2})
+        return apply_update(
+            state, stability=3, treasury=-4, factions={"royal": 4, "bureaucrats": -1}
+        )
+    return apply_update(
+        state, stability=-2, legitimacy=-1, factions={"bureaucrats": 2, "royal": -2}
+    )
 
 
 def event_tax(choice: str, state: State) -> State:
     if choice == "raise":
-        state = apply_deltas(state, treasury=6, public_support=-4, stability=-2)
-        return apply_faction_deltas(state, {"bureaucrats": 2, "merchants": -2})
-    state = apply_deltas(state, treasury=-3, public_support=3)
-    return apply_faction_deltas(state, {"merchants": 2, "bureaucrats": -1})
+        return apply_update(
+            state,
+            treasury=6,
+            public_support=-4,
+            stability=-2,
+            factions={"bureaucrats": 2, "merchants": -2},
+        )
+    return apply_update(
+        state, treasury=-3, public_support=3, factions={"merchants": 2, "bureaucrats": -1}
+    )
 
 
 def event_court_choice(choice: str, state: State) -> State:
     if choice == "conciliate":
-        state = apply_deltas(state, legitimacy=2, stability=2)
-        return apply_faction_deltas(state, {"clans": 3, "royal": -2})
-    state = apply_deltas(state, legitimacy=-2, stability=-3)
-    return apply_faction_deltas(state, {"royal": 3, "clans": -3})
+        return apply_update(state, legitimacy=2, stability=2, factions={"clans": 3, "royal": -2})
+    return apply_update(state, legitimacy=-2, stability=-3, factions={"royal": 3, "clans": -3})
 
 
 def event_black_market(choice: str, state: State) -> State:
     if choice == "crackdown":
-        state = apply_deltas(state, stability=2, public_support=-1)
-        return apply_faction_deltas(state, {"bureaucrats": 2, "merchants": -3})
-    state = apply_deltas(state, treasury=3, public_support=1)
-    return apply_faction_deltas(state, {"merchants": 3, "bureaucrats": -1})
+        return apply_update(
+            state, stability=2, public_support=-1, factions={"bureaucrats": 2, "merchants": -3}
+        )
+    return apply_update(
+        state, treasury=3, public_support=1, factions={"merchants": 3, "bureaucrats": -1}
+    )
 
 
 def event_famine_relief(choice: str, state: State) -> State:
     if choice == "mobilize":
-        state = apply_deltas(state, food=6, treasury=-4, public_support=4)
-        return apply_faction_deltas(state, {"bureaucrats": 2, "royal": 1})
-    state = apply_deltas(state, food=-3, stability=-4, public_support=-4)
-    return apply_faction_deltas(state, {"clans": 2, "royal": -2})
+        return apply_update(
+            state, food=6, treasury=-4, public_support=4, factions={"bureaucrats": 2, "royal": 1}
+        )
+    return apply_update(
+        state, food=-3, stability=-4, public_support=-4, factions={"clans": 2, "royal": -2}
+    )
 
 
 def event_chancellor(choice: str, state: State) -> State:
@@ -215,10 +352,10 @@ def event_chancellor(choice: str, state: State) -> State:
 
 def event_general(choice: str, state: State) -> State:
     if choice == "patrols":
-        state = apply_deltas(state, stability=0.5, revolt_risk=-1, treasury=-0.5)
-        return apply_faction_deltas(state, {"warlords": 0.5})
-    state = apply_deltas(state, stability=-0.5, revolt_risk=0.5)
-    return apply_faction_deltas(state, {"warlords": 0.5})
+        return apply_update(
+            state, stability=0.5, revolt_risk=-1, treasury=-0.5, factions={"warlords": 0.5}
+        )
+    return apply_update(state, stability=-0.5, revolt_risk=0.5, factions={"warlords": 0.5})
 
 
 def event_treasurer(choice: str, state: State) -> State:
@@ -229,10 +366,10 @@ def event_treasurer(choice: str, state: State) -> State:
 
 def event_clan_head(choice: str, state: State) -> State:
     if choice == "pledge":
-        state = apply_deltas(state, stability=0.5, public_support=0.5)
-        return apply_faction_deltas(state, {"clans": 0.5, "royal": -0.5})
-    state = apply_deltas(state, stability=-0.5, legitimacy=-0.5)
-    return apply_faction_deltas(state, {"clans": 0.5})
+        return apply_update(
+            state, stability=0.5, public_support=0.5, factions={"clans": 0.5, "royal": -0.5}
+        )
+    return apply_update(state, stability=-0.5, legitimacy=-0.5, factions={"clans": 0.5})
 
 
 def event_spymaster(choice: str, state: State) -> State:
@@ -251,12 +388,12 @@ EVENTS: List[Event] = [
             EventChoice(id="contain", label="경비를 늘려 소요를 막는다."),
             EventChoice(id="appease", label="현장 조정을 통해 진정시킨다."),
         ],
-        condition=minor_riot_condition,
+        condition=MINOR_RIOT_CONDITION,
         apply=event_minor_riot,
         actor="system",
-        cause_tags=["riot", "security"],
+        cause_tags=("riot", "security"),
         severity=2,
-        stakeholders=[],
+        stakeholders=(),
     ),
     Event(
         id="major-riot",
@@ -267,12 +404,12 @@ EVENTS: List[Event] = [
             EventChoice(id="contain", label="병력을 동원해 폭동을 진압한다."),
             EventChoice(id="appease", label="급히 민심을 달래며 진정시킨다."),
         ],
-        condition=riot_condition,
+        condition=RIOT_CONDITION,
         apply=event_major_riot,
         actor="system",
-        cause_tags=["riot", "security"],
+        cause_tags=("riot", "security"),
         severity=4,
-        stakeholders=[],
+        stakeholders=(),
     ),
     Event(
         id="chancellor-council",
@@ -283,15 +420,15 @@ EVENTS: List[Event] = [
             EventChoice(id="council", label="개혁 의제를 올려 합의를 만든다."),
             EventChoice(id="delay", label="논의를 미루고 현상 유지를 택한다."),
         ],
-        condition=lambda state: (
-            state.actors["Chancellor"]["influence"] >= 70
-            and state.actors["Chancellor"]["loyalty"] >= 55
+        condition=(
+            ("actors.Chancellor.influence", ">=", 70),
+            ("actors.Chancellor.loyalty", ">=", 55),
         ),
         apply=event_chancellor,
         actor="Chancellor",
-        cause_tags=["bureaucracy", "stability"],
+        cause_tags=("bureaucracy", "stability"),
         severity=2,
-        stakeholders=["Chancellor"],
+        stakeholders=("Chancellor",),
     ),
     Event(
         id="general-patrols",
@@ -302,12 +439,12 @@ EVENTS: List[Event] = [
             EventChoice(id="patrols", label="도성을 순찰해 질서를 다잡는다."),
             EventChoice(id="standby", label="병력을 대기시켜 부담을 줄인다."),
         ],
-        condition=lambda state: state.actors["General"]["ambition"] >= 70,
+        condition=(("actors.General.ambition", ">=", 70),),
         apply=event_general,
         actor="General",
-        cause_tags=["security", "military"],
+        cause_tags=("security", "military"),
         severity=2,
-        stakeholders=["General"],
+        stakeholders=("General",),
     ),
     Event(
         id="treasurer-audit",
@@ -318,14 +455,12 @@ EVENTS: List[Event] = [
             EventChoice(id="audit", label="지출을 엄격히 통제한다."),
             EventChoice(id="relief", label="지원을 유지하며 완충한다."),
         ],
-        condition=lambda state: (
-            state.actors["Treasurer"]["loyalty"] >= 70 and state.treasury <= 55
-        ),
+        condition=(("actors.Treasurer.loyalty", ">=", 70), ("treasury", "<=", 55)),
         apply=event_treasurer,
         actor="Treasurer",
-        cause_tags=["economy", "bureaucracy"],
+        cause_tags=("economy", "bureaucracy"),
         severity=2,
-        stakeholders=["Treasurer"],
+        stakeholders=("Treasurer",),
     ),
     Event(
         id="clanhead-pledge",
@@ -336,12 +471,12 @@ EVENTS: List[Event] = [
             EventChoice(id="pledge", label="충성 서약을 받아낸다."),
             EventChoice(id="ignore", label="침묵 속 긴장을 두고 본다."),
         ],
-        condition=lambda state: state.actors["ClanHead"]["influence"] >= 70,
+        condition=(("actors.ClanHead.influence", ">=", 70),),
         apply=event_clan_head,
         actor="ClanHead",
-        cause_tags=["clan", "stability"],
+        cause_tags=("clan", "stability"),
         severity=2,
-        stakeholders=["ClanHead"],
+        stakeholders=("ClanHead",),
     ),
     Event(
         id="spymaster-reports",
@@ -352,12 +487,12 @@ EVENTS: List[Event] = [
             EventChoice(id="reports", label="잠복 정보를 바탕으로 정비한다."),
             EventChoice(id="overlook", label="위협을 과소평가한다."),
         ],
-        condition=lambda state: state.actors["Spymaster"]["influence"] >= 70,
+        condition=(("actors.Spymaster.influence", ">=", 70),),
         apply=event_spymaster,
         actor="Spymaster",
-        cause_tags=["intrigue", "security"],
+        cause_tags=("intrigue", "security"),
         severity=2,
-        stakeholders=["Spymaster"],
+        stakeholders=("Spymaster",),
     ),
     Event(
         id="chancellor-faction-lean",
@@ -368,12 +503,12 @@ EVENTS: List[Event] = [
             EventChoice(id="council", label="세력 간 균형을 강조한다."),
             EventChoice(id="delay", label="일정을 늦춰 변화를 피한다."),
         ],
-        condition=lambda state: state.actors["Chancellor"]["loyalty"] <= 35,
+        condition=(("actors.Chancellor.loyalty", "<=", 35),),
         apply=event_chancellor,
         actor="Chancellor",
-        cause_tags=["bureaucracy", "factions"],
+        cause_tags=("bureaucracy", "factions"),
         severity=2,
-        stakeholders=["Chancellor"],
+        stakeholders=("Chancellor",),
     ),
     Event(
         id="general-frontier",
@@ -384,14 +519,12 @@ EVENTS: List[Event] = [
             EventChoice(id="patrols", label="군단을 분산 배치한다."),
             EventChoice(id="standby", label="병력을 한곳에 모은다."),
         ],
-        condition=lambda state: (
-            state.actors["General"]["influence"] >= 65 and state.factions["warlords"] >= 60
-        ),
+        condition=(("actors.General.influence", ">=", 65), ("factions.warlords", ">=", 60)),
         apply=event_general,
         actor="General",
-        cause_tags=["military", "security"],
+        cause_tags=("military", "security"),
         severity=2,
-        stakeholders=["General"],
+        stakeholders=("General",),
     ),
     Event(
         id="spymaster-whispers",
@@ -402,12 +535,12 @@ EVENTS: List[Event] = [
             EventChoice(id="reports", label="소문을 통제한다."),
             EventChoice(id="overlook", label="흐름을 지켜본다."),
         ],
-        condition=lambda state: state.actors["Spymaster"]["ambition"] >= 70,
+        condition=(("actors.Spymaster.ambition", ">=", 70),),
         apply=event_spymaster,
         actor="Spymaster",
-        cause_tags=["intrigue", "stability"],
+        cause_tags=("intrigue", "stability"),
         severity=2,
-        stakeholders=["Spymaster"],
+        stakeholders=("Spymaster",),
     ),
     Event(
         id="granary-crackdown",
@@ -418,12 +551,12 @@ EVENTS: List[Event] = [
             EventChoice(id="audit", label="감사단을 보내 세곡을 회수한다."),
             EventChoice(id="pardon", label="유출을 눈감고 상단과 타협한다."),
         ],
-        condition=lambda state: state.turn == 1,
+        condition=(("turn", "==", 1),),
         apply=event_granary,
         actor="system",
-        cause_tags=["economy", "food"],
+        cause_tags=("economy", "food"),
         severity=3,
-        stakeholders=[],
+        stakeholders=(),
     ),
     Event(
         id="border-lords",
@@ -434,12 +567,12 @@ EVENTS: List[Event] = [
             EventChoice(id="reinforce", label="방어선을 강화한다."),
             EventChoice(id="delay", label="군량을 아끼고 방치한다."),
         ],
-        condition=lambda state: state.factions["warlords"] >= 50,
+        condition=(("factions.warlords", ">=", 50),),
         apply=event_border,
         actor="system",
-        cause_tags=["military", "security"],
+        cause_tags=("military", "security"),
         severity=3,
-        stakeholders=[],
+        stakeholders=(),
     ),
     Event(
         id="bureaucrat-reform",
@@ -450,12 +583,12 @@ EVENTS: List[Event] = [
             EventChoice(id="promote", label="개혁안을 수용한다."),
             EventChoice(id="reject", label="문벌의 힘을 보전한다."),
         ],
-        condition=lambda state: state.factions["bureaucrats"] >= 55,
+        condition=(("factions.bureaucrats", ">=", 55),),
         apply=event_reform,
         actor="system",
-        cause_tags=["bureaucracy", "factions"],
+        cause_tags=("bureaucracy", "factions"),
         severity=3,
-        stakeholders=[],
+        stakeholders=(),
     ),
     Event(
         id="trade-charter",
@@ -466,12 +599,12 @@ EVENTS: List[Event] = [
             EventChoice(id="open", label="개방을 허락한다."),
             EventChoice(id="limit", label="상단을 규제한다."),
         ],
-        condition=lambda state: state.factions["merchants"] >= 50,
+        condition=(("factions.merchants", ">=", 50),),
         apply=event_trade,
         actor="system",
-        cause_tags=["trade", "economy"],
+        cause_tags=("trade", "economy"),
         severity=2,
-        stakeholders=[],
+        stakeholders=(),
     ),
     Event(
         id="harvest-appeal",
@@ -482,12 +615,12 @@ EVENTS: List[Event] = [
             EventChoice(id="release", label="곡물 창고를 연다."),
             EventChoice(id="tax", label="추가 세곡을 걷는다."),
         ],
-        condition=lambda state: state.food >= 55,
+        condition=(("food", ">=", 55),),
         apply=event_harvest,
         actor="system",
-        cause_tags=["food", "economy"],
+        cause_tags=("food", "economy"),
         severity=2,
-        stakeholders=[],
+        stakeholders=(),
     ),
     Event(
         id="royal-guard",
@@ -498,12 +631,12 @@ EVENTS: List[Event] = [
             EventChoice(id="expand", label="친위대를 확대한다."),
             EventChoice(id="delay", label="확충을 유예한다."),
         ],
-        condition=lambda state: state.legitimacy <= 55,
+        condition=(("legitimacy", "<=", 55),),
         apply=event_royal_guard,
         actor="system",
-        cause_tags=["security", "factions"],
+        cause_tags=("security", "factions"),
         severity=3,
-        stakeholders=[],
+        stakeholders=(),
     ),
     Event(
         id="tax-reform",
@@ -514,12 +647,12 @@ EVENTS: List[Event] = [
             EventChoice(id="raise", label="세율을 올린다."),
             EventChoice(id="ease", label="세율을 낮춘다."),
         ],
-        condition=lambda state: state.treasury <= 45,
+        condition=(("treasury", "<=", 45),),
         apply=event_tax,
         actor="system",
-        cause_tags=["economy", "bureaucracy"],
+        cause_tags=("economy", "bureaucracy"),
         severity=3,
-        stakeholders=[],
+        stakeholders=(),
     ),
     Event(
         id="court-petition",
@@ -530,12 +663,12 @@ EVENTS: List[Event] = [
             EventChoice(id="conciliate", label="상소를 수용한다."),
             EventChoice(id="reject", label="왕권을 강조한다."),
         ],
-        condition=lambda state: state.factions["clans"] >= 52 and state.stability < 60,
+        condition=(("factions.clans", ">=", 52), ("stability", "<", 60)),
         apply=event_court_choice,
         actor="system",
-        cause_tags=["clan", "factions"],
+        cause_tags=("clan", "factions"),
         severity=3,
-        stakeholders=[],
+        stakeholders=(),
     ),
     Event(
         id="black-market",
@@ -546,12 +679,12 @@ EVENTS: List[Event] = [
             EventChoice(id="crackdown", label="단속을 강화한다."),
             EventChoice(id="tolerate", label="거래를 묵인한다."),
         ],
-        condition=lambda state: state.public_support < 55,
+        condition=(("public_support", "<", 55),),
         apply=event_black_market,
         actor="system",
-        cause_tags=["trade", "intrigue"],
+        cause_tags=("trade", "intrigue"),
         severity=2,
-        stakeholders=[],
+        stakeholders=(),
     ),
     Event(
         id="famine-relief",
@@ -562,11 +695,13 @@ EVENTS: List[Event] = [
             EventChoice(id="mobilize", label="구휼과 군량 조달을 지시한다."),
             EventChoice(id="delay", label="지원을 늦춘다."),
         ],
-        condition=lambda state: state.food < 40,
+        condition=(("food", "<", 40),),
         apply=event_famine_relief,
         actor="system",
-        cause_tags=["food", "stability"],
+        cause_tags=("food", "stability"),
         severity=4,
-        stakeholders=[],
+        stakeholders=(),
     ),
 ]
+
+EVENTS_BY_PRIORITY = group_by_priority(EVENTS)
@@ -20,7 +20,7 @@ def compute_metrics(log: Iterable[Dict]) -> Dict[str, float]:
             if value <= 0.0 or value >= 100.0:
                 clamp_hits += 1
 
-    avg_revolt = revolt_total / max(turn_count, 1)
+    avg_revolt = revolt_total / turn_count if turn_count else 0.0
     return {
         "min_public_support": round(min_support, 2),
         "avg_rebellion_risk": round(avg_revolt, 2),
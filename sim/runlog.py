@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .engine import DECISION_CAUSE_TAGS, DECISION_ID
+from .events import Event, serialize_event
+from .state import ACTOR_ROLES, ACTOR_STATS, FACTION_KEYS, State
+
+SCALAR_FIELDS = ("stability", "legitimacy", "treasury", "food", "public_support", "revolt_risk")
+
+
+def float_column(size: int) -> array:
+    return array("d", [0.0]) * size
+
+
+@dataclass
+class RunLog:
+    capacity: int
+    size: int = 0
+    turn: array = field(init=False)
+    riot_cooldown_until: array = field(init=False)
+    scalars: Dict[str, array] = field(init=False)
+    factions: Dict[str, array] = field(init=False)
+    actors: Dict[Tuple[str, str], array] = field(init=False)
+    events: List[Optional[Event]] = field(init=False)
+    decisions: Dict[int, str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.turn = array("i", [0]) * self.capacity
+        self.riot_cooldown_until = array("i", [0]) * self.capacity
+        self.scalars = {name: float_column(self.capacity) for name in SCALAR_FIELDS}
+        self.factions = {key: float_column(self.capacity) for key in FACTION_KEYS}
+        self.actors = {
+            (role, stat): float_column(self.capacity)
+            for role in ACTOR_ROLES
+            for stat in ACTOR_STATS
+        }
+        self.events = [None] * self.capacity
+        self.decisions = {}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Dict]:
+        return (self.record(index) for index in range(self.size))
+
+    def append(self, state: State, event: Optional[Event]) -> int:
+        index = self.size
+        self.turn[index] = state.turn
+        self.riot_cooldown_until[index] = state.riot_cooldown_until
+        for name, column in self.scalars.items():
+            column[index] = round(getattr(state, name), 2)
+        for column, value in zip(self.factions.values(), state.factions):
+            column[index] = round(value, 2)
+        for role, stats in zip(ACTOR_ROLES, state.actors):
+            for stat, value in zip(ACTOR_STATS, stats):
+                self.actors[role, stat][index] = round(value, 2)
+        self.events[index] = event
+        self.size = index + 1
+        return index
+
+    def mark_decision(self, index: int, choice: str) -> None:
+        self.decisions[index] = choice
+
+    def record(self, index: int) -> Dict:
+        state = {"turn": self.turn[index]}
+        for name, column in self.scalars.items():
+            state[name] = column[index]
+        state["riot_cooldown_until"] = self.riot_cooldown_until[index]
+        state["factions"] = {key: column[index] for key, column in self.factions.items()}
+        state["actors"] = {
+            role: {stat: self.actors[role, stat][index] for stat in ACTOR_STATS}
+            for role in ACTOR_ROLES
+        }
+        record = {"state": state, "event": serialize_event(self.events[index])}
+        choice = self.decisions.get(index)
+        if choice is not None:
+            record["decision_id"] = DECISION_ID
+            record["choice"] = choice
+            record["actor"] = "Chancellor"
+            record["cause_tags"] = DECISION_CAUSE_TAGS
+        return record
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import json
-from typing import Dict, Iterable, List, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-from ai.summarize import compact_events, rule_explain
 from .engine import (
     DECISION_CAUSE_TAGS,
     DECISION_DURATION,
@@ -14,74 +19,182 @@ from .engine import (
     is_riot,
     step,
 )
-from .state import ACTOR_ROLES, initial_state, serialize_state
+from .events import Event, serialize_event
+from .runlog import RunLog
+from .state import State, StateSerializer, initial_state
 
+JSONL_BUFFER_SIZE = 1 << 20
+JSONL_CHUNK_RECORDS = 1000
+DELTA_KEYFRAME_INTERVAL = 50
 
-def run_simulation(turns: int, rng) -> Tuple[List[Dict], Dict]:
-    state = initial_state()
-    log: List[Dict] = []
-    bankruptcies = 0
-    riots = 0
-    support_total = 0.0
-    decision_choice: str | None = None
-    decision_remaining = 0
-
-    for _ in range(turns):
-        if decision_remaining > 0 and decision_choice:
-            state = apply_decision_tick(state, decision_choice)
-            decision_remaining -= 1
-
-        state, event = step(state, rng)
-        if is_bankrupt(state):
-            bankruptcies += 1
-        if is_riot(state):
-            riots += 1
-        support_total += state.public_support
-
-        record = {
-            "state": serialize_state(state),
-            "event": None
-            if event is None
-            else {
-                "id": event.id,
-                "title": event.title,
-                "actor": normalize_actor(event.actor),
-                "cause_tags": event.cause_tags,
-                "severity": event.severity,
-                "stakeholders": event.stakeholders,
-            },
+RecordFn = Callable[[State, Optional[Event]], Dict]
+TurnResult = Tuple[State, Optional[Event], Optional[str]]
+
+
+def full_record_fn() -> RecordFn:
+    serialize = StateSerializer()
+
+    def record(state: State, event: Optional[Event]) -> Dict:
+        return {"state": serialize(state), "event": serialize_event(event)}
+
+    return record
+
+
+def minimal_record_fn() -> RecordFn:
+    serialize = StateSerializer()
+
+    def record(state: State, event: Optional[Event]) -> Dict:
+        return {
+            "state": serialize(state),
+            "event": None if event is None else {"id": event.id, "title": event.title},
         }
 
-        if decision_choice is None and (
-            is_riot(state) or state.revolt_risk >= 55.0
-        ):
-            windowed = log[-20:] + [record]
-            rule_explain(compact_events(windowed), windowed)
-            decision_choice = "A" if rng.random() < 0.5 else "B"
-            state = apply_decision_immediate(state, decision_choice)
-            decision_remaining = DECISION_DURATION
-            record["decision_id"] = DECISION_ID
-            record["choice"] = decision_choice
-            record["actor"] = "Chancellor"
-            record["cause_tags"] = DECISION_CAUSE_TAGS
-
-        log.append(record)
-
-    avg_support = support_total / max(turns, 1)
-    summary = {
-        "bankruptcies": bankruptcies,
-        "riots": riots,
-        "avg_public_support": round(avg_support, 2),
-        "final_factions": state.factions,
-    }
-    return log, summary
+    return record
+
+
+@dataclass
+class ScenarioRun:
+    turns: int
+    rng: Any
+    scenario: str = "baseline"
+    decisions: bool = True
+    summary: Dict = field(default_factory=dict)
+
+    def __iter__(self) -> Iterator[TurnResult]:
+        rng = self.rng
+        turns = self.turns
+        decisions = self.decisions
+        state = initial_state(self.scenario)
+        bankruptcies = 0
+        riots = 0
+        support_total = 0.0
+        decision_choice: str | None = None
+        decision_remaining = 0
+
+        for _ in range(turns):
+            if decision_remaining > 0 and decision_choice:
+                state = apply_decision_tick(state, decision_choice)
+                decision_remaining -= 1
+
+            state, event = step(state, rng)
+            riot = is_riot(state)
+            if is_bankrupt(state):
+                bankruptcies += 1
+            if riot:
+                riots += 1
+            support_total += state.public_support
+
+            recorded = state
+            choice = None
+
+            if decisions and decision_choice is None and (riot or state.revolt_risk >= 55.0):
+                decision_choice = "A" if rng.random() < 0.5 else "B"
+                state = apply_decision_immediate(state, decision_choice)
+                decision_remaining = DECISION_DURATION
+                choice = decision_choice
+
+            yield recorded, event, choice
+
+        avg_support = support_total / turns if turns else 0.0
+        self.summary = {
+            "bankruptcies": bankruptcies,
+            "riots": riots,
+            "avg_public_support": round(avg_support, 2),
+            "final_factions": state.factions._asdict(),
+        }
+
+    def records(self, record_fn: Optional[RecordFn] = None) -> Iterator[Dict]:
+        record_fn = record_fn or full_record_fn()
+        for state, event, choice in self:
+            record = record_fn(state, event)
+            if choice is not None:
+                record["decision_id"] = DECISION_ID
+                record["choice"] = choice
+                record["actor"] = "Chancellor"
+                record["cause_tags"] = DECISION_CAUSE_TAGS
+            yield record
+
+
+def run_with_scenario(
+    turns: int,
+    rng,
+    scenario: str = "baseline",
+    record_fn: Optional[RecordFn] = None,
+    decisions: bool = True,
+) -> Tuple[List[Dict], Dict]:
+    run = ScenarioRun(turns, rng, scenario, decisions)
+    log = list(run.records(record_fn))
+    return log, run.summary
+
+
+def run_simulation(turns: int, rng) -> Tuple[List[Dict], Dict]:
+    return run_with_scenario(turns, rng)
+
+
+def run_columnar(turns: int, rng, scenario: str = "baseline") -> Tuple[RunLog, Dict]:
+    log = RunLog(turns)
+    run = ScenarioRun(turns, rng, scenario)
+    for state, event, choice in run:
+        index = log.append(state, event)
+        if choice is not None:
+            log.mark_decision(index, choice)
+    return log, run.summary
+
+
+if orjson is not None:
+    loads_line = orjson.loads
+
+    def dumps_line(record: Dict) -> bytes:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+
+else:
+    loads_line = json.loads
+
+    def dumps_line(record: Dict) -> bytes:
+        text = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        return (text + "\n").encode("utf-8")
 
 
 def write_jsonl(path, records: Iterable[Dict]) -> None:
-    with open(path, "w", encoding="utf-8") as handle:
+    with open(path, "wb", buffering=JSONL_BUFFER_SIZE) as handle:
+        chunk: List[bytes] = []
         for record in records:
-            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+            chunk.append(dumps_line(record))
+            if len(chunk) >= JSONL_CHUNK_RECORDS:
+                handle.writelines(chunk)
+                chunk.clear()
+        handle.writelines(chunk)
+
+
+def iter_jsonl(path) -> Iterator[Dict]:
+    with open(path, "rb", buffering=JSONL_BUFFER_SIZE) as handle:
+        for line in handle:
+            if line.strip():
+                yield loads_line(line)
+
+
+def delta_records(
+    records: Iterable[Dict], keyframe_every: int = DELTA_KEYFRAME_INTERVAL
+) -> Iterator[Dict]:
+    previous: Optional[Dict] = None
+    for index, record in enumerate(records):
+        state = record["state"]
+        rest = {key: value for key, value in record.items() if key != "state"}
+        if previous is None or index % keyframe_every == 0:
+            yield {"keyframe": state, **rest}
+        else:
+            diff = {key: value for key, value in state.items() if previous.get(key) != value}
+            yield {"diff": diff, **rest}
+        previous = state
+
 
+def expand_delta_records(records: Iterable[Dict]) -> Iterator[Dict]:
+    state: Dict = {}
+    for record in records:
+        record = dict(record)
+        if "keyframe" in record:
+            state = record.pop("keyframe")
+        else:
+            state = {**state, **record.pop("diff")}
+        yield {"state": state, **record}
 
-def normalize_actor(actor: str) -> str:
-    return actor if actor in ACTOR_ROLES else "Chancellor"
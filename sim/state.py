@@ -1,13 +1,40 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, replace
-from typing import Dict
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional
 
 FACTION_KEYS = ("royal", "bureaucrats", "warlords", "merchants", "clans")
 ACTOR_ROLES = ("Chancellor", "General", "Treasurer", "ClanHead", "Spymaster")
+ACTOR_STATS = ("loyalty", "ambition", "influence")
+FACTION_INDEX = {key: index for index, key in enumerate(FACTION_KEYS)}
+ACTOR_INDEX = {role: index for index, role in enumerate(ACTOR_ROLES)}
+ACTOR_STAT_INDEX = {stat: index for index, stat in enumerate(ACTOR_STATS)}
 
 
-@dataclass(frozen=True)
+class Factions(NamedTuple):
+    royal: float
+    bureaucrats: float
+    warlords: float
+    merchants: float
+    clans: float
+
+
+class ActorStats(NamedTuple):
+    loyalty: float
+    ambition: float
+    influence: float
+
+
+class Actors(NamedTuple):
+    Chancellor: ActorStats
+    General: ActorStats
+    Treasurer: ActorStats
+    ClanHead: ActorStats
+    Spymaster: ActorStats
+
+
+@dataclass(frozen=True, slots=True)
 class State:
     turn: int
     stability: float
@@ -17,81 +44,95 @@ class State:
     public_support: float
     revolt_risk: float
     riot_cooldown_until: int
-    factions: Dict[str, float]
-    actors: Dict[str, Dict[str, float]]
+    factions: Factions
+    actors: Actors
 
 
 def clamp(value: float, low: float = 0.0, high: float = 100.0) -> float:
-    return max(low, min(high, value))
+    return low if value <= low else high if value >= high else value
 
 
-def normalize_factions(factions: Dict[str, float]) -> Dict[str, float]:
-    return {key: clamp(factions.get(key, 50.0)) for key in FACTION_KEYS}
+def normalize_factions(factions: Dict[str, float]) -> Factions:
+    return Factions(*(clamp(factions.get(key, 50.0)) for key in FACTION_KEYS))
 
 
-def normalize_actors(actors: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
-    normalized: Dict[str, Dict[str, float]] = {}
+def normalize_actors(actors: Dict[str, Dict[str, float]]) -> Actors:
+    normalized: List[ActorStats] = []
     for role in ACTOR_ROLES:
         stats = actors.get(role, {})
-        normalized[role] = {
-            "loyalty": clamp(stats.get("loyalty", 50.0)),
-            "ambition": clamp(stats.get("ambition", 50.0)),
-            "influence": clamp(stats.get("influence", 50.0)),
+        normalized.append(ActorStats(*(clamp(stats.get(stat, 50.0)) for stat in ACTOR_STATS)))
+    return Actors._make(normalized)
+
+
+def freeze_mapping(mapping: Dict[str, Any]) -> Mapping[str, Any]:
+    return MappingProxyType(
+        {
+            key: freeze_mapping(value) if isinstance(value, dict) else value
+            for key, value in mapping.items()
         }
-    return normalized
-
-
-SCENARIOS = {
-    "baseline": {},
-    "famine": {
-        "stability": 45.0,
-        "legitimacy": 50.0,
-        "treasury": 48.0,
-        "food": 25.0,
-        "public_support": 40.0,
-        "revolt_risk": 45.0,
-        "factions": {
-            "royal": 52.0,
-            "bureaucrats": 50.0,
-            "warlords": 48.0,
-            "merchants": 45.0,
-            "clans": 50.0,
+    )
+
+
+SCENARIOS = freeze_mapping(
+    {
+        "baseline": {},
+        "famine": {
+            "stability": 45.0,
+            "legitimacy": 50.0,
+            "treasury": 48.0,
+            "food": 25.0,
+            "public_support": 40.0,
+            "revolt_risk": 45.0,
+            "factions": {
+                "royal": 52.0,
+                "bureaucrats": 50.0,
+                "warlords": 48.0,
+                "merchants": 45.0,
+                "clans": 50.0,
+            },
         },
-    },
-    "deficit": {
-        "stability": 58.0,
-        "legitimacy": 56.0,
-        "treasury": 20.0,
-        "food": 55.0,
-        "public_support": 54.0,
-        "revolt_risk": 32.0,
-        "factions": {
-            "royal": 56.0,
-            "bureaucrats": 48.0,
-            "warlords": 42.0,
-            "merchants": 42.0,
-            "clans": 46.0,
+        "deficit": {
+            "stability": 58.0,
+            "legitimacy": 56.0,
+            "treasury": 20.0,
+            "food": 55.0,
+            "public_support": 54.0,
+            "revolt_risk": 32.0,
+            "factions": {
+                "royal": 56.0,
+                "bureaucrats": 48.0,
+                "warlords": 42.0,
+                "merchants": 42.0,
+                "clans": 46.0,
+            },
         },
-    },
-    "warlord": {
-        "stability": 55.0,
-        "legitimacy": 52.0,
-        "treasury": 50.0,
-        "food": 55.0,
-        "public_support": 50.0,
-        "revolt_risk": 40.0,
-        "factions": {
-            "royal": 45.0,
-            "bureaucrats": 50.0,
-            "warlords": 70.0,
-            "merchants": 46.0,
-            "clans": 52.0,
+        "warlord": {
+            "stability": 55.0,
+            "legitimacy": 52.0,
+            "treasury": 50.0,
+            "food": 55.0,
+            "public_support": 50.0,
+            "revolt_risk": 40.0,
+            "factions": {
+                "royal": 45.0,
+                "bureaucrats": 50.0,
+                "warlords": 70.0,
+                "merchants": 46.0,
+                "clans": 52.0,
+            },
         },
-    },
-}
+    }
+)
 
 
 def initial_state(scenario: str = "baseline") -> State:
+    state = _INITIAL_STATES.get(scenario)
+    if state is None:
+        raise ValueError(f"Unknown scenario: {scenario}")
+    return state
+
+
+def _build_state(scenario: str) -> State:
     base_state = State(
         turn=0,
         stability=62.0,
@@ -120,15 +161,12 @@ def initial_state(scenario: str = "baseline") -> State:
             }
         ),
     )
-    overrides = SCENARIOS.get(scenario)
-    if overrides is None:
-        raise ValueError(f"Unknown scenario: {scenario}")
-
+    overrides = SCENARIOS[scenario]
     if not overrides:
         return base_state
 
     factions_override = overrides.get("factions", {})
-    factions = normalize_factions({**base_state.factions, **factions_override})
+    actors_override = overrides.get("actors", {})
     return replace(
         base_state,
         stability=overrides.get("stability", base_state.stability),
@@ -138,33 +176,85 @@ def initial_state(scenario: str = "baseline") -> State:
         public_support=overrides.get("public_support", base_state.public_support),
         revolt_risk=overrides.get("revolt_risk", base_state.revolt_risk),
         riot_cooldown_until=overrides.get("riot_cooldown_until", base_state.riot_cooldown_until),
-        factions=factions,
-        actors=normalize_actors({**base_state.actors, **overrides.get("actors", {})}),
+        factions=Factions._make(
+            clamp(factions_override.get(key, value))
+            for key, value in zip(FACTION_KEYS, base_state.factions)
+        ),
+        actors=Actors._make(
+            ActorStats(*(clamp(actors_override[role].get(stat, 50.0)) for stat in ACTOR_STATS))
+            if role in actors_override
+            else stats
+            for role, stats in zip(ACTOR_ROLES, base_state.actors)
+        ),
     )
 
 
+_INITIAL_STATES: Dict[str, State] = {scenario: _build_state(scenario) for scenario in SCENARIOS}
+
+
 def apply_deltas(state: State, **deltas: float) -> State:
-    return replace(
-        state,
-        stability=clamp(state.stability + deltas.get("stability", 0.0)),
-        legitimacy=clamp(state.legitimacy + deltas.get("legitimacy", 0.0)),
-        treasury=clamp(state.treasury + deltas.get("treasury", 0.0)),
-        food=clamp(state.food + deltas.get("food", 0.0)),
-        public_support=clamp(state.public_support + deltas.get("public_support", 0.0)),
-        revolt_risk=clamp(state.revolt_risk + deltas.get("revolt_risk", 0.0)),
+    return State(
+        turn=state.turn,
+        riot_cooldown_until=state.riot_cooldown_until,
+        factions=state.factions,
+        actors=state.actors,
+        **shifted_scalars(state, deltas),
     )
 
 
-def apply_faction_deltas(state: State, updates: Dict[str, float]) -> State:
-    factions = dict(state.factions)
+def apply_update(
+    state: State, factions: Optional[Dict[str, float]] = None, **deltas: float
+) -> State:
+    shifted = state.factions
+    if factions is not None:
+        shifted = shifted_factions(state.factions, factions)
+    return State(
+        turn=state.turn,
+        riot_cooldown_until=state.riot_cooldown_until,
+        factions=shifted,
+        actors=state.actors,
+        **shifted_scalars(state, deltas),
+    )
+
+
+def shifted_scalars(state: State, deltas: Dict[str, float]) -> Dict[str, float]:
+    get = deltas.get
+    return {
+        "stability": clamp(state.stability + get("stability", 0.0)),
+        "legitimacy": clamp(state.legitimacy + get("legitimacy", 0.0)),
+        "treasury": clamp(state.treasury + get("treasury", 0.0)),
+        "food": clamp(state.food + get("food", 0.0)),
+        "public_support": clamp(state.public_support + get("public_support", 0.0)),
+        "revolt_risk": clamp(state.revolt_risk + get("revolt_risk", 0.0)),
+    }
+
+
+def shifted_factions(
+    factions: Factions, updates: Dict[str, float], soft_cap: bool = True
+) -> Factions:
+    values = list(factions)
     for key, delta in updates.items():
-        if key not in factions:
+        index = FACTION_INDEX.get(key)
+        if index is None:
             continue
-        factions[key] = clamp(factions[key] + delta)
-    return replace(state, factions=factions)
+        before = values[index]
+        value = clamp(before + delta)
+        rise = value - before
+        if soft_cap and rise > 0:
+            if before >= 95.0:
+                rise *= 0.15
+            elif before >= 85.0:
+                rise *= 0.35
+            value = clamp(before + rise)
+        values[index] = value
+    return Factions._make(values)
+
+
+def serialize_factions(factions: Factions) -> Dict[str, float]:
+    return {key: round(value, 2) for key, value in zip(FACTION_KEYS, factions)}
 
 
-def serialize_state(state: State) -> Dict[str, float]:
+def serialize_state(state: State, factions: Optional[Dict[str, float]] = None) -> Dict[str, float]:
     return {
         "turn": state.turn,
         "stability": round(state.stability, 2),
@@ -174,9 +264,25 @@ def serialize_state(state: State) -> Dict[str, float]:
         "public_support": round(state.public_support, 2),
         "revolt_risk": round(state.revolt_risk, 2),
         "riot_cooldown_until": state.riot_cooldown_until,
-        "factions": {key: round(value, 2) for key, value in state.factions.items()},
+        "factions": serialize_factions(state.factions) if factions is None else factions,
         "actors": {
-            role: {key: round(value, 2) for key, value in stats.items()}
-            for role, stats in state.actors.items()
+            role: {
+                "loyalty": round(loyalty, 2),
+                "ambition": round(ambition, 2),
+                "influence": round(influence, 2),
+            }
+            for role, (loyalty, ambition, influence) in zip(ACTOR_ROLES, state.actors)
         },
     }
+
+
+class StateSerializer:
+    def __init__(self) -> None:
+        self._source: Optional[Factions] = None
+        self._factions: Optional[Dict[str, float]] = None
+
+    def __call__(self, state: State) -> Dict[str, float]:
+        if state.factions != self._source:
+            self._source = state.factions
+            self._factions = serialize_factions(state.factions)
+        return serialize_state(state, self._factions)
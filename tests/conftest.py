@@ -0,0 +1,30 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+BASE_STATE_TEMPLATE = {
+    "stability": 50,
+    "legitimacy": 50,
+    "treasury": 50,
+    "food": 50,
+    "public_support": 50,
+    "revolt_risk": 10,
+    "factions": {"royal": 50, "bureaucrats": 50, "warlords": 50, "merchants": 50, "clans": 50},
+    "actors": {"Chancellor": {"loyalty": 60, "ambition": 40, "influence": 50}},
+}
+
+
+def make_entry(turn, event=None, **overrides):
+    return {"state": {"turn": turn, **BASE_STATE_TEMPLATE, **overrides}, "event": event}
+
+
+def write_cursor(log_path, turn):
+    cursor_path = log_path.with_suffix(log_path.suffix + ".cursor")
+    cursor_path.write_bytes(b"%d" % turn)
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,44 @@
+from conftest import make_entry
+from sim.simulate import dumps_line, write_jsonl
+
+
+def general_event(turn, severity):
+    return {
+        "id": f"event-{turn}",
+        "title": f"Event {turn}",
+        "actor": "General",
+        "cause_tags": ["military", "security"],
+        "severity": severity,
+        "stakeholders": ["General"],
+    }
+
+
+def test_explain_cache_follows_log_changes(tmp_path, client):
+    log_path = tmp_path / "run.jsonl"
+    write_jsonl(log_path, [make_entry(1, event=general_event(1, 2), revolt_risk=40)])
+
+    body = {"scenario": "warlord", "seed": 7, "turn_window": 20, "log_path": str(log_path)}
+    first = client.post("/ai/explain", json=body)
+    again = client.post("/ai/explain", json=body)
+    assert first.status_code == 200
+    assert again.json() == first.json()
+    assert "심각도 2" in first.json()["text"]
+
+    with log_path.open("ab") as handle:
+        handle.write(dumps_line(make_entry(2, event=general_event(2, 5), revolt_risk=40)))
+
+    updated = client.post("/ai/explain", json=body)
+    assert updated.status_code == 200
+    assert "심각도 5" in updated.json()["text"]
+
+
+def test_explain_with_api_key_retries_after_llm_failure(tmp_path, client, monkeypatch):
+    log_path = tmp_path / "run.jsonl"
+    write_jsonl(log_path, [make_entry(1, event=general_event(1, 2), revolt_risk=40)])
+    responses = iter([None, "첫째 문장. 둘째 문장. 셋째 문장."])
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr("ai.summarize.call_openai", lambda messages, model: next(responses))
+
+    body = {"scenario": "warlord", "seed": 8, "turn_window": 20, "log_path": str(log_path)}
+    assert client.post("/ai/explain", json=body).json()["mode"] == "rule"
+    assert client.post("/ai/explain", json=body).json()["mode"] == "llm"
@@ -1,7 +1,7 @@
-import json
 import re
 
 from ai.summarize import chronicle_summary, explain_summary
+from sim.simulate import write_jsonl
 
 
 def test_rule_summaries_format(tmp_path):
@@ -30,9 +30,7 @@ def test_rule_summaries_format(tmp_path):
             },
         },
     ]
-    with log_path.open("w", encoding="utf-8") as handle:
-        for entry in entries:
-            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    write_jsonl(log_path, entries)
 
     explain = explain_summary("warlord", 7, 20, str(log_path))
     assert explain["mode"] == "rule"
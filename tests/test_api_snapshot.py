@@ -1,11 +1,7 @@
-import json
+from sim.simulate import write_jsonl
 
-from fastapi.testclient import TestClient
 
-from app.main import app
-
-
-def test_api_snapshot_fields(tmp_path):
+def test_api_snapshot_fields(tmp_path, client):
     log_path = tmp_path / "sample.jsonl"
     entries = [
         {
@@ -44,11 +40,8 @@ def test_api_snapshot_fields(tmp_path):
             "event": None,
         },
     ]
-    with log_path.open("w", encoding="utf-8") as handle:
-        for entry in entries:
-            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    write_jsonl(log_path, entries)
 
-    client = TestClient(app)
     response = client.post(
         "/api/snapshot",
         json={
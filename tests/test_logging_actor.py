@@ -1,7 +1,7 @@
 import random
 
 from sim.engine import step
-from sim.simulate import normalize_actor
+from sim.events import normalize_actor
 from sim.state import ACTOR_ROLES, initial_state, serialize_state
 
 
@@ -1,8 +1,7 @@
 import random
 
 from sim.engine import step
-from sim.events import CAUSE_TAGS
-from sim.simulate import normalize_actor
+from sim.events import CAUSE_TAGS, normalize_actor
 from sim.state import ACTOR_ROLES, initial_state, serialize_state
 
 
@@ -1,48 +1,25 @@
-import json
+from conftest import make_entry
+from sim.simulate import write_jsonl
 
-from fastapi.testclient import TestClient
 
-from app.main import app
-
-
-def test_next_turn_advances_cursor(tmp_path):
+def test_next_turn_advances_cursor(tmp_path, client):
     log_path = tmp_path / "run.jsonl"
-    entries = []
-    for turn in range(1, 6):
-        entries.append(
+    entries = [
+        make_entry(
+            turn,
             {
-                "state": {
-                    "turn": turn,
-                    "stability": 50,
-                    "legitimacy": 50,
-                    "treasury": 50,
-                    "food": 50,
-                    "public_support": 50,
-                    "revolt_risk": 10,
-                    "factions": {
-                        "royal": 50,
-                        "bureaucrats": 50,
-                        "warlords": 50,
-                        "merchants": 50,
-                        "clans": 50,
-                    },
-                    "actors": {"Chancellor": {"loyalty": 60, "ambition": 40, "influence": 50}},
-                },
-                "event": {
-                    "id": f"event-{turn}",
-                    "title": f"Event {turn}",
-                    "actor": "Chancellor",
-                    "cause_tags": ["riot"],
-                    "severity": 2,
-                    "stakeholders": ["Chancellor"],
-                },
-            }
+                "id": f"event-{turn}",
+                "title": f"Event {turn}",
+                "actor": "Chancellor",
+                "cause_tags": ["riot"],
+                "severity": 2,
+                "stakeholders": ["Chancellor"],
+            },
         )
-    with log_path.open("w", encoding="utf-8") as handle:
-        for entry in entries:
-            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        for turn in range(1, 6)
+    ]
+    write_jsonl(log_path, entries)
 
-    client = TestClient(app)
     last_turns = []
     for _ in range(3):
         response = client.post(
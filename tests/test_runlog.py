@@ -0,0 +1,54 @@
+import random
+
+from sim.engine import step
+from sim.runlog import RunLog
+from sim.simulate import (
+    ScenarioRun,
+    delta_records,
+    expand_delta_records,
+    iter_jsonl,
+    run_columnar,
+    run_with_scenario,
+    write_jsonl,
+)
+from sim.state import initial_state, serialize_state
+
+
+def test_runlog_matches_serialized_states():
+    rng = random.Random(11)
+    state = initial_state("famine")
+    log = RunLog(40)
+    expected = []
+
+    for _ in range(40):
+        state, event = step(state, rng)
+        log.append(state, event)
+        expected.append(serialize_state(state))
+
+    records = list(log)
+    assert len(log) == 40
+    assert [record["state"] for record in records] == expected
+
+
+def test_streamed_scenario_matches_runlog(tmp_path):
+    log, summary = run_columnar(80, random.Random(3), "warlord")
+    streamed_path = tmp_path / "streamed.jsonl"
+    columnar_path = tmp_path / "columnar.jsonl"
+    streamed = ScenarioRun(80, random.Random(3), "warlord")
+    write_jsonl(streamed_path, streamed.records())
+    write_jsonl(columnar_path, log)
+
+    assert streamed_path.read_bytes() == columnar_path.read_bytes()
+    assert streamed.summary == summary
+
+
+def test_delta_records_round_trip(tmp_path):
+    log, _ = run_with_scenario(120, random.Random(5), "famine")
+    full_path = tmp_path / "full.jsonl"
+    delta_path = tmp_path / "delta.jsonl"
+    write_jsonl(full_path, log)
+    write_jsonl(delta_path, delta_records(log))
+
+    written = list(iter_jsonl(delta_path))
+    assert sum("keyframe" in record for record in written) == 3
+    assert list(expand_delta_records(written)) == list(iter_jsonl(full_path))
@@ -0,0 +1,34 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from sim import api
+from sim.api import app
+
+
+@pytest.fixture(autouse=True)
+def clear_sessions():
+    api._sessions.clear()
+    yield
+    api._sessions.clear()
+
+
+def test_sessions_keep_separate_state():
+    client = TestClient(app)
+
+    first = client.post("/step", params={"session_id": "alpha"}).json()
+    client.post("/step", params={"session_id": "alpha"})
+    fresh = client.post("/step", params={"session_id": "beta"}).json()
+
+    assert fresh == first
+    assert client.get("/state", params={"session_id": "alpha"}).json()["state"]["turn"] == 2
+    assert client.get("/state", params={"session_id": "beta"}).json()["state"] == fresh["state"]
+
+
+def test_run_with_seed_is_reproducible_per_session():
+    client = TestClient(app)
+    params = {"turns": 10, "seed": 7}
+
+    first = client.post("/run", params={**params, "session_id": "alpha"}).json()
+    second = client.post("/run", params={**params, "session_id": "beta"}).json()
+
+    assert first == second
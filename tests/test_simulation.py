@@ -1,10 +1,12 @@
 import random
 from dataclasses import replace
 
+import pytest
+
 from sim.engine import is_bankrupt, is_riot
-from sim.events import EVENTS
+from sim.events import EVENTS, condition_mask, field_getter
 from sim.simulate import run_simulation
-from sim.state import initial_state
+from sim.state import Factions, initial_state, shifted_factions
 
 
 def test_reproducibility_with_seed():
@@ -39,8 +41,8 @@ def test_event_apply_is_consistent():
     assert updated.treasury == state.treasury + 6
     assert updated.stability == state.stability + 2
     assert updated.legitimacy == state.legitimacy + 1
-    assert updated.factions["bureaucrats"] == state.factions["bureaucrats"] + 4
-    assert updated.factions["merchants"] == state.factions["merchants"] - 2
+    assert updated.factions.bureaucrats == state.factions.bureaucrats + 4
+    assert updated.factions.merchants == state.factions.merchants - 2
 
 
 def test_bankruptcy_and_riot_conditions():
@@ -52,8 +54,46 @@ def test_bankruptcy_and_riot_conditions():
     assert is_riot(riot_state)
 
 
+def test_condition_mask_follows_event_conditions():
+    events_by_id = {event.id: event for event in EVENTS}
+    riot_events = [events_by_id["major-riot"], events_by_id["minor-riot"]]
+    mask = condition_mask(riot_events)
+    state = initial_state()
+    riot_state = replace(state, public_support=25, stability=35, revolt_risk=65)
+
+    assert mask(state) == 0
+    assert mask(riot_state) == 0b11
+    assert mask(replace(riot_state, riot_cooldown_until=5)) == 0b10
+
+
+@pytest.mark.parametrize(
+    "path", ["morale", "factions.nobles", "actors.General.zeal", "stability.x"]
+)
+def test_field_getter_rejects_unknown_paths(path):
+    with pytest.raises(ValueError, match="Unknown state path"):
+        field_getter(path)
+
+
 def test_simulation_runs_120_turns():
     rng = random.Random(1)
     log, _summary = run_simulation(120, rng)
 
     assert len(log) == 120
+
+
+@pytest.mark.parametrize(
+    "before, delta, soft_cap, expected",
+    [
+        (84.0, 4.0, True, 88.0),
+        (90.0, 4.0, True, 91.4),
+        (96.0, 4.0, True, 96.6),
+        (96.0, -4.0, True, 92.0),
+        (90.0, 4.0, False, 94.0),
+    ],
+)
+def test_faction_soft_cap_thresholds(before, delta, soft_cap, expected):
+    factions = Factions(before, 50.0, 50.0, 50.0, 50.0)
+    shifted = shifted_factions(factions, {"royal": delta}, soft_cap)
+
+    assert shifted.royal == pytest.approx(expected)
+    assert shifted[1:] == factions[1:]